@@ -2,6 +2,7 @@
 
 from .database import (
     get_db_connection,
+    load_cached_data,
     load_country_data,
     load_data_from_table,
     load_time_series_data,
@@ -10,6 +11,7 @@ from .database import (
 from .queries import (
     AID_TYPE_CONFIG,
     AID_TYPES_COLUMNS,
+    ALLOCATIONS_VS_COMMITMENTS_QUERY,
     BUDGET_SUPPORT_COLUMNS,
     COUNTRY_AID_COLUMNS,
     COUNTRY_AID_TABLE,  # Add this
@@ -44,6 +46,7 @@ from .queries import (
 __all__ = [
     # Functions
     "get_db_connection",
+    "load_cached_data",
     "load_data_from_table",
     "load_time_series_data",
     "load_country_data",
@@ -85,6 +88,7 @@ __all__ = [
     "GULF_WAR_COMPARISON_QUERY",
     "DOMESTIC_COMPARISON_QUERY",
     "EUROPEAN_CRISIS_QUERY",
+    "ALLOCATIONS_VS_COMMITMENTS_QUERY",
     # Other constants
     "COUNTRY_GROUPS",
     "AID_TYPE_CONFIG",
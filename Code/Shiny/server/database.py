@@ -1,5 +1,7 @@
 """Database connection and query functions."""
 
+import functools
+
 import duckdb
 from config import DB_PATH
 
@@ -45,6 +47,29 @@ def load_data_from_table(
         conn.close()
 
 
+@functools.lru_cache(maxsize=64)
+def load_cached_data(
+    table_name_or_query: str, columns=None, where_clause=None, order_by=None
+):
+    """Load data from table or execute query, caching the result per process.
+
+    The database is opened read-only, so results for a given table name or
+    query string never change while the app is running. Caching them lets
+    every session share one DataFrame instead of re-querying on startup.
+
+    Args:
+        table_name_or_query (str): Table name or SQL query to load.
+        columns (tuple, optional): Column names to fetch from a table.
+        where_clause (str, optional): Filter applied to a table.
+        order_by (str, optional): Ordering applied to a table.
+
+    Returns:
+        pandas.DataFrame: Shared result frame. Callers must not modify it in
+            place; use ``.copy()`` or derive new frames instead.
+    """
+    return load_data_from_table(table_name_or_query, columns, where_clause, order_by)
+
+
 def load_time_series_data(columns=None):
     """Load time series data from database.
 
@@ -76,7 +101,7 @@ def load_country_data(columns=None):
         columns (list, optional): List of column names to fetch. If None, fetches default columns.
 
     Returns:
-        pandas.DataFrame: Country aid data
+        pandas.DataFrame: Country aid data, shared through ``load_cached_data``.
     """
     # If no columns specified, use default set
     if columns is None:
@@ -84,9 +109,9 @@ def load_country_data(columns=None):
 
     total_aid = " + ".join(col for col in columns if col != "country")
 
-    return load_data_from_table(
+    return load_cached_data(
         table_name_or_query=COUNTRY_AID_TABLE,
-        columns=columns,
+        columns=tuple(columns),
         where_clause="country IS NOT NULL",
         order_by=f"({total_aid}) DESC",
     )
@@ -105,6 +130,7 @@ def load_weapon_stocks_data():
 # For backward compatibility and convenience
 __all__ = [
     "get_db_connection",
+    "load_cached_data",
     "load_time_series_data",
     "load_country_data",
     "TOTAL_SUPPORT_COLUMNS",
@@ -196,7 +196,14 @@ WW2_EQUIPMENT_CATEGORIZED_QUERY = """
         category,
         weapon_type,
         SUM(delivered) as delivered,
-        SUM(to_be_delivered) as to_be_delivered
+        SUM(to_be_delivered) as to_be_delivered,
+        -- Share of the largest delivery within the category
+        SUM(delivered) * 100.0
+            / NULLIF(MAX(SUM(delivered)) OVER (PARTITION BY category), 0)
+            as delivered_pct,
+        SUM(to_be_delivered) * 100.0
+            / NULLIF(MAX(SUM(delivered)) OVER (PARTITION BY category), 0)
+            as to_be_delivered_pct
     FROM base_data
     WHERE category IS NOT NULL
         AND military_conflict IS NOT NULL
@@ -471,6 +478,20 @@ GERMAN_COMPARISON_QUERY = """
 """
 
 
+ALLOCATIONS_VS_COMMITMENTS_QUERY = """
+    SELECT
+        country,
+        committed_aid,
+        allocated_aid,
+        committed_aid - allocated_aid as to_be_allocated,
+        allocated_aid / committed_aid as delivery_ratio,
+        allocated_aid / committed_aid * 100 as allocated_pct,
+        100.0 - allocated_aid / committed_aid * 100 as to_be_allocated_pct
+    FROM d_allocations_vs_commitments
+    ORDER BY committed_aid DESC
+"""
+
+
 def build_group_allocations_query(aid_type, selected_groups):
     """Build the complete query for group allocations."""
     group_filter = ", ".join(f"'{group}'" for group in selected_groups)
@@ -5,14 +5,18 @@ creating visual variations of existing colors in visualizations.
 """
 
 import colorsys
+import functools
 
 
+@functools.lru_cache(maxsize=64)
 def desaturate_color(hex_color: str, factor: float = 0.75) -> str:
     """Create a desaturated version of a hex color.
 
     This function takes a hex color and creates a lighter version by adjusting
     its HSL (Hue, Saturation, Lightness) values. Commonly used for creating
     secondary or background variations of primary colors in visualizations.
+    Results are memoized, as the same palette colors are desaturated on
+    every render.
 
     Args:
         hex_color: Hex color string (e.g., '#FF0000' or 'FF0000')
@@ -5,6 +5,9 @@ that compares committed versus allocated aid across different country groups,
 with support for toggling visibility of individual groups.
 """
 
+import logging
+
+import duckdb
 import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE, MARGIN
@@ -18,6 +21,8 @@ from shinywidgets import output_widget, render_widget
 
 from ....colorutilities import desaturate_color
 
+logger = logging.getLogger(__name__)
+
 
 class AidAllocationCard:
     """UI components for the aid allocation by country groups card.
@@ -75,6 +80,12 @@ class AidAllocationServer:
         },
     }
 
+    # Base color per country group, resolved once from the palette
+    GROUP_COLORS: dict[str, str] = {
+        group: COLOR_PALETTE[config["color_key"]]
+        for group, config in COUNTRY_GROUP_CONFIG.items()
+    }
+
     # Define trace configurations
     TRACE_TYPES: dict[str, dict[str, object]] = {
         "committed": {
@@ -115,15 +126,14 @@ class AidAllocationServer:
         Returns:
             pd.DataFrame: Filtered DataFrame containing aid allocation data.
         """
+        query = build_group_allocations_query(
+            aid_type="total",
+            selected_groups=list(COUNTRY_GROUPS.keys()),
+        )
         try:
-            query = build_group_allocations_query(
-                aid_type="total",
-                selected_groups=list(COUNTRY_GROUPS.keys()),
-            )
             return load_data_from_table(query)
-
-        except Exception as e:
-            print(f"Error in _compute_filtered_data: {str(e)}")
+        except duckdb.Error:
+            logger.exception("Failed to load group allocations")
             return pd.DataFrame(
                 columns=["group_name", "allocated_aid", "committed_aid"]
             )
@@ -157,24 +167,27 @@ class AidAllocationServer:
         """
         fig = go.Figure()
 
-        for _, row in data.iterrows():
-            group_config = self.COUNTRY_GROUP_CONFIG[row["group_name"]]
-            display_name = group_config["display_name"]
-            base_color = COLOR_PALETTE[group_config["color_key"]]
+        # Each group keeps its own pair of traces so it can be toggled in the legend
+        for group_name, committed_aid, allocated_aid in zip(
+            data["group_name"].to_numpy(),
+            data["committed_aid"].to_numpy(),
+            data["allocated_aid"].to_numpy(),
+            strict=True,
+        ):
+            display_name = self.COUNTRY_GROUP_CONFIG[group_name]["display_name"]
+            base_color = self.GROUP_COLORS[group_name]
 
             # Calculate percentage for allocated aid text
             percentage = (
-                (row["allocated_aid"] / row["committed_aid"] * 100)
-                if row["committed_aid"] > 0
-                else 0
+                (allocated_aid / committed_aid * 100) if committed_aid > 0 else 0
             )
 
             # Add traces for committed and allocated aid
             self._add_aid_traces(
                 fig=fig,
                 display_name=display_name,
-                committed_aid=row["committed_aid"],
-                allocated_aid=row["allocated_aid"],
+                committed_aid=committed_aid,
+                allocated_aid=allocated_aid,
                 percentage=percentage,
                 base_color=base_color,
             )
@@ -133,8 +133,7 @@ class TotalSupportServer:
         result = self.df[["month"] + selected_cols].copy()
 
         if self.input.total_support_additive():
-            for col in selected_cols:
-                result[col] = result[col].cumsum()
+            result[selected_cols] = result[selected_cols].cumsum()
             result["total"] = result[selected_cols].sum(axis=1)
 
         return result
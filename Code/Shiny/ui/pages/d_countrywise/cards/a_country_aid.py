@@ -5,7 +5,7 @@ that breaks down different types of aid (financial, humanitarian, military, refu
 provided by each donor country.
 """
 
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE, MARGIN
 from server import load_country_data
@@ -71,17 +71,67 @@ class CountryAidServer:
         input: Shiny input object containing user interface values.
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
-        df (pd.DataFrame): DataFrame containing country aid data.
+        df (pd.DataFrame): Shared DataFrame containing country aid data.
     """
 
-    # Define aid type configurations as a class constant
+    # Define aid type configurations as a class constant, with palette colors
+    # resolved once at import
     AID_TYPES: dict[str, dict[str, str]] = {
-        "financial": {"color": "financial", "name": "Financial"},
-        "humanitarian": {"color": "humanitarian", "name": "Humanitarian"},
-        "military": {"color": "military", "name": "Military"},
-        "refugee_cost_estimation": {"color": "refugee", "name": "Refugee Support"},
+        "financial": {"color": COLOR_PALETTE.get("financial"), "name": "Financial"},
+        "humanitarian": {
+            "color": COLOR_PALETTE.get("humanitarian"),
+            "name": "Humanitarian",
+        },
+        "military": {"color": COLOR_PALETTE.get("military"), "name": "Military"},
+        "refugee_cost_estimation": {
+            "color": COLOR_PALETTE.get("refugee"),
+            "name": "Refugee Support",
+        },
     }
 
+    # Static layout, validated once at import; only the height changes later
+    BASE_LAYOUT = go.Layout(
+        title=dict(
+            text=f"Aid Allocation and Refugee Support Cost by Country and Type<br><sub>Last updated: {LAST_UPDATE}, Sheet: Fig 6</sub>",
+            font=dict(size=14),
+            y=0.95,
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+        ),
+        xaxis_title="Billion €",
+        barmode="stack",
+        template="plotly_white",
+        height=400,
+        margin=MARGIN,
+        legend=dict(
+            yanchor="bottom",
+            y=0.01,
+            xanchor="right",
+            x=0.99,
+            bgcolor="rgba(255, 255, 255, 0.8)",
+            bordercolor="rgba(0, 0, 0, 0.2)",
+            borderwidth=1,
+        ),
+        showlegend=True,
+        hovermode="y unified",
+        autosize=True,
+        yaxis=dict(
+            showgrid=False,
+            gridcolor="rgba(0,0,0,0.1)",
+            zerolinecolor="rgba(0,0,0,0.2)",
+            tickfont=dict(size=12),
+            categoryorder="total ascending",
+        ),
+        xaxis=dict(
+            showgrid=False,
+            gridcolor="rgba(0,0,0,0.1)",
+            zerolinecolor="rgba(0,0,0,0.2)",
+        ),
+        plot_bgcolor="rgba(255,255,255,1)",
+        paper_bgcolor="rgba(255,255,255,1)",
+    )
+
     def __init__(self, input, output, session):
         """Initialize the server component.
 
@@ -94,76 +144,117 @@ class CountryAidServer:
         self.output = output
         self.session = session
         self.df = load_country_data()
+        self._countries, self._values = self._prepare_sorted_data()
+        self._fig = self._create_base_figure()
         self._filtered_data = reactive.Calc(self._compute_filtered_data)
         self.register_outputs()
 
-    def _compute_filtered_data(self) -> pd.DataFrame:
-        """Filter and process data based on user selections.
+    def _prepare_sorted_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """Rank countries by total aid once, since the data does not change.
 
         Returns:
-            pd.DataFrame: Filtered and sorted DataFrame containing aid data for top N countries.
+            Tuple[np.ndarray, np.ndarray]: Country names and a contiguous
+                (countries x aid types) value matrix, both sorted by total
+                aid in descending order.
         """
-        # Get list of aid type columns
-        aid_cols = list(self.AID_TYPES.keys())
+        values = self.df[list(self.AID_TYPES.keys())].to_numpy(dtype=np.float64)
+        # nansum ranks countries with a missing cell by the aid they do have
+        order = np.argsort(-np.nansum(values, axis=1), kind="stable")
+        return (
+            self.df["country"].to_numpy()[order],
+            np.ascontiguousarray(values[order]),
+        )
 
-        # Create copy and calculate totals
-        result = self.df.copy()
-        result["total_aid"] = result[aid_cols].sum(axis=1)
+    def _compute_filtered_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """Filter and process data based on user selections.
 
-        # Filter to top N countries and sort
-        result = result.nlargest(self.input.top_n_countries_total_aid(), "total_aid")
-        result = result.sort_values("total_aid", ascending=True)
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Country names and value matrix for the
+                top N countries, in ascending order of total aid.
+        """
+        n = self.input.top_n_countries_total_aid()
+        return self._countries[:n][::-1], self._values[:n][::-1]
 
-        return result[["country"] + aid_cols]
+    def create_plot(self) -> go.FigureWidget:
+        """Generate the country aid visualization widget.
 
-    def create_plot(self) -> go.Figure:
-        """Generate the country aid visualization plot.
+        The widget is a copy of the base figure, so the server's template is
+        never modified. Without selected countries its traces are left empty,
+        which keeps the widget in place for later selections to patch.
 
         Returns:
-            go.Figure: Plotly figure object containing the stacked bar chart.
+            go.FigureWidget: Plotly widget containing the stacked bar chart.
         """
-        data = self._filtered_data()
-        if data.empty:
-            return go.Figure()
+        countries, values = self._filtered_data()
+        return self._update_stacked_bar_chart(
+            go.FigureWidget(self._fig), countries, values
+        )
 
-        # Calculate dynamic height based on number of countries
-        dynamic_height = max(400, len(data) * 40)
+    def _create_base_figure(self) -> go.Figure:
+        """Create the stacked bar chart with empty traces and the static layout.
 
-        # Create and configure plot
-        fig = self._create_stacked_bar_chart(data, dynamic_height)
+        Only the bar values and the height change with the user's selection,
+        so the traces are configured once per server and the layout once per
+        process.
 
-        return fig
+        Returns:
+            go.Figure: Configured Plotly figure object without data.
+        """
+        return go.Figure(
+            data=[
+                self._create_bar_trace(
+                    countries=[],
+                    values=[],
+                    name=properties["name"],
+                    color=properties["color"],
+                )
+                for properties in self.AID_TYPES.values()
+            ],
+            layout=self.BASE_LAYOUT,
+        )
 
-    def _create_stacked_bar_chart(self, data: pd.DataFrame, height: int) -> go.Figure:
-        """Create a stacked bar chart visualization.
+    def _update_stacked_bar_chart(
+        self, fig: go.Figure, countries: np.ndarray, values: np.ndarray
+    ) -> go.Figure:
+        """Update the stacked bar chart with new data.
+
+        Works on both the server-side figure and the rendered widget; on a
+        widget, only the changed trace data and height are sent to the browser.
 
         Args:
-            data: DataFrame containing filtered aid data.
-            height: Height of the plot in pixels.
+            fig: Plotly figure or figure widget to update in place.
+            countries: Array of country names.
+            values: Matrix of aid values, one column per trace.
 
         Returns:
-            go.Figure: Configured Plotly figure object.
+            go.Figure: The updated figure.
         """
-        fig = go.Figure()
-        countries = data["country"].tolist()
-
-        # Add bars for each aid type
-        for aid_type, properties in self.AID_TYPES.items():
-            values = data[aid_type].tolist()
-            fig.add_trace(
-                self._create_bar_trace(
-                    countries=countries,
-                    values=values,
-                    name=properties["name"],
-                    color=COLOR_PALETTE.get(properties["color"]),
-                )
-            )
+        # Calculate dynamic height based on number of countries
+        height = max(400, len(countries) * 40)
 
-        # Update layout
-        self._update_figure_layout(fig, height)
+        # Arrays go to Plotly as-is and are serialized as typed binary buffers
+        with fig.batch_update():
+            for trace, column in zip(fig.data, values.T, strict=True):
+                trace.y = countries
+                trace.x = column
+                trace.text = self._format_bar_text(column)
+            fig.layout.height = height
 
         return fig
 
+    @staticmethod
+    def _format_bar_text(values: np.ndarray) -> np.ndarray:
+        """Format bar values as in-bar labels, hiding empty segments.
+
+        Args:
+            values: Array of values for the bars.
+
+        Returns:
+            np.ndarray: Label for each bar.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        return np.where(values > 0, np.char.mod("%.1f", values), "")
+
     def _create_bar_trace(
         self, countries: list[str], values: list[float], name: str, color: str
     ) -> go.Bar:
@@ -185,65 +276,27 @@ class CountryAidServer:
             orientation="h",
             marker_color=color,
             hovertemplate=f"%{{y}}<br>{name}: %{{x:.1f}} Billion €<extra></extra>",
-            text=[f"{v:.1f}" if v > 0 else "" for v in values],
+            text=self._format_bar_text(values),
             textposition="inside",
             textfont=dict(color="white"),
             insidetextanchor="middle",
         )
 
-    def _update_figure_layout(self, fig: go.Figure, height: int) -> None:
-        """Update the layout of the figure.
+    def register_outputs(self) -> None:
+        """Register the plot output with Shiny.
 
-        Args:
-            fig: Plotly figure object to update.
-            height: Height of the plot in pixels.
+        The widget is rendered once. Later selections patch its traces in place
+        instead of re-sending and re-mounting the whole figure.
         """
-        fig.update_layout(
-            title=dict(
-                text=f"Aid Allocation and Refugee Support Cost by Country and Type<br><sub>Last updated: {LAST_UPDATE}, Sheet: Fig 6</sub>",
-                font=dict(size=14),
-                y=0.95,
-                x=0.5,
-                xanchor="center",
-                yanchor="top",
-            ),
-            xaxis_title="Billion €",
-            barmode="stack",
-            template="plotly_white",
-            height=height,
-            margin=MARGIN,
-            legend=dict(
-                yanchor="bottom",
-                y=0.01,
-                xanchor="right",
-                x=0.99,
-                bgcolor="rgba(255, 255, 255, 0.8)",
-                bordercolor="rgba(0, 0, 0, 0.2)",
-                borderwidth=1,
-            ),
-            showlegend=True,
-            hovermode="y unified",
-            autosize=True,
-            yaxis=dict(
-                showgrid=False,
-                gridcolor="rgba(0,0,0,0.1)",
-                zerolinecolor="rgba(0,0,0,0.2)",
-                tickfont=dict(size=12),
-                categoryorder="total ascending",
-            ),
-            xaxis=dict(
-                showgrid=False,
-                gridcolor="rgba(0,0,0,0.1)",
-                zerolinecolor="rgba(0,0,0,0.2)",
-            ),
-            plot_bgcolor="rgba(255,255,255,1)",
-            paper_bgcolor="rgba(255,255,255,1)",
-        )
-
-    def register_outputs(self) -> None:
-        """Register the plot output with Shiny."""
 
         @self.output
         @render_widget
         def country_aid_plot():
-            return self.create_plot()
+            with reactive.isolate():
+                return self.create_plot()
+
+        @reactive.effect
+        def _update_country_aid_plot():
+            self._update_stacked_bar_chart(
+                country_aid_plot.widget, *self._filtered_data()
+            )
@@ -5,6 +5,9 @@ that compares bilateral aid, refugee costs, and EU share allocations as percenta
 of each donor country's GDP.
 """
 
+import functools
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE, MARGIN
@@ -13,6 +16,25 @@ from shiny import reactive, ui
 from shinywidgets import output_widget, render_widget
 
 
+@functools.lru_cache(maxsize=1)
+def load_gdp_allocations_data() -> pd.DataFrame:
+    """Load and merge allocation and summary data once per process.
+
+    Returns:
+        pd.DataFrame: Merged DataFrame containing allocation and GDP data.
+    """
+    df_allocations = load_data_from_table("f_bilateral_allocations_gdp_pct")
+    df_summary = load_data_from_table(
+        "a_summary_€", columns=["country", "share_in_total_eu_allocations__2021_gdp"]
+    )
+
+    # Countries are unique in the summary, so a lookup replaces the left merge
+    share = df_summary.set_index("country")["share_in_total_eu_allocations__2021_gdp"]
+    return df_allocations.assign(
+        share_in_total_eu_allocations__2021_gdp=df_allocations["country"].map(share)
+    )
+
+
 class GDPAllocationsCard:
     """UI components for the GDP allocations visualization card.
 
@@ -68,28 +90,72 @@ class GDPAllocationsServer:
         input: Shiny input object containing user interface values.
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
-        df (pd.DataFrame): DataFrame containing combined allocation and GDP data.
+        df (pd.DataFrame): Shared DataFrame containing combined allocation and GDP data.
     """
 
     # Define allocation types and their properties
     ALLOCATION_TYPES: dict[str, dict[str, str]] = {
         "total_bilateral_allocations": {
             "name": "Total bilateral allocations",
-            "color": "Total Bilateral",
+            "color": COLOR_PALETTE.get("Total Bilateral"),
             "hover_template": "Total bilateral allocations: %{x:.2f}% of GDP",
         },
         "refugee_cost_estimation": {
             "name": "Refugee cost estimation",
-            "color": "refugee",
+            "color": COLOR_PALETTE.get("refugee"),
             "hover_template": "Refugee cost estimation: %{x:.2f}% of GDP",
         },
         "share_in_total_eu_allocations__2021_gdp": {
             "name": "Share in total EU allocations",
-            "color": "europe",
+            "color": COLOR_PALETTE.get("europe"),
             "hover_template": "Share in total EU allocations: %{x:.2f}% of GDP",
         },
     }
 
+    # Static layout, validated once at import; only the height changes later
+    BASE_LAYOUT = go.Layout(
+        title=dict(
+            text=f"Bilateral Aid, Refugee Costs, and EU Share<br><sub>Last updated: {LAST_UPDATE}, Sheet: Summary(€), Fig 6</sub>",
+            font=dict(size=14),
+            y=0.95,
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+        ),
+        xaxis_title="Percentage of 2021 GDP",
+        barmode="stack",
+        template="plotly_white",
+        height=400,
+        margin=MARGIN,
+        legend=dict(
+            yanchor="bottom",
+            y=0.01,
+            xanchor="right",
+            x=0.99,
+            bgcolor="rgba(255, 255, 255, 0.8)",
+            bordercolor="rgba(0, 0, 0, 0.2)",
+            borderwidth=1,
+        ),
+        showlegend=True,
+        hovermode="y unified",
+        autosize=True,
+        yaxis=dict(
+            showgrid=False,
+            gridcolor="rgba(0,0,0,0.1)",
+            zerolinecolor="rgba(0,0,0,0.2)",
+            tickfont=dict(size=12),
+            categoryorder="total ascending",
+        ),
+        xaxis=dict(
+            showgrid=False,
+            gridcolor="rgba(0,0,0,0.1)",
+            zerolinecolor="rgba(0,0,0,0.2)",
+            tickformat=".1f",
+        ),
+        plot_bgcolor="rgba(255,255,255,1)",
+        paper_bgcolor="rgba(255,255,255,1)",
+    )
+
     def __init__(self, input, output, session):
         """Initialize the server component.
 
@@ -101,92 +167,118 @@ class GDPAllocationsServer:
         self.input = input
         self.output = output
         self.session = session
-        self.df = self._load_and_merge_data()
+        self.df = load_gdp_allocations_data()
+        self._countries, self._values = self._prepare_sorted_data()
+        self._fig = self._create_base_figure()
         self._filtered_data = reactive.Calc(self._compute_filtered_data)
         self.register_outputs()
 
-    def _load_and_merge_data(self) -> pd.DataFrame:
-        """Load and merge allocation and summary data.
+    def _prepare_sorted_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """Rank countries by total allocations once, since the data does not change.
 
         Returns:
-            pd.DataFrame: Merged DataFrame containing allocation and GDP data.
+            Tuple[np.ndarray, np.ndarray]: Country names and a contiguous
+                (countries x allocation types) value matrix, both sorted by total
+                allocations in descending order.
         """
-        df_allocations = load_data_from_table("f_bilateral_allocations_gdp_pct")
-        df_summary = load_data_from_table("a_summary_€")
-
-        return pd.merge(
-            df_allocations,
-            df_summary[["country", "share_in_total_eu_allocations__2021_gdp"]],
-            on="country",
-            how="left",
+        values = self.df[list(self.ALLOCATION_TYPES.keys())].to_numpy(dtype=np.float64)
+        # nansum ranks countries with a missing cell by the aid they do have
+        order = np.argsort(-np.nansum(values, axis=1), kind="stable")
+        return (
+            self.df["country"].to_numpy()[order],
+            np.ascontiguousarray(values[order]),
         )
 
-    def _compute_filtered_data(self) -> pd.DataFrame:
+    def _compute_filtered_data(self) -> tuple[np.ndarray, np.ndarray]:
         """Filter and process data based on user selections.
 
         Returns:
-            pd.DataFrame: Filtered and sorted DataFrame containing top N countries.
+            Tuple[np.ndarray, np.ndarray]: Country names and value matrix for the
+                top N countries, in ascending order of total allocations.
         """
-        result = self.df.copy()
-        allocation_cols = list(self.ALLOCATION_TYPES.keys())
+        n = self.input.top_n_countries_gdp_ratio()
+        return self._countries[:n][::-1], self._values[:n][::-1]
+
+    def create_plot(self) -> go.FigureWidget:
+        """Generate the GDP allocations visualization widget.
 
-        # Calculate total for sorting
-        result["total"] = result[allocation_cols].sum(axis=1)
+        The widget is a copy of the base figure, so the server's template is
+        never modified. Without selected countries its traces are left empty,
+        which keeps the widget in place for later selections to patch.
 
-        # Get top N countries and sort
-        result = result.nlargest(self.input.top_n_countries_gdp_ratio(), "total")
-        result = result.sort_values("total", ascending=True)
+        Returns:
+            go.FigureWidget: Plotly widget containing the stacked bar chart.
+        """
+        countries, values = self._filtered_data()
+        return self._update_stacked_bar_chart(
+            go.FigureWidget(self._fig), countries, values
+        )
 
-        return result[["country"] + allocation_cols]
+    def _create_base_figure(self) -> go.Figure:
+        """Create the stacked bar chart with empty traces and the static layout.
 
-    def create_plot(self) -> go.Figure:
-        """Generate the GDP allocations visualization plot.
+        Only the bar values and the height change with the user's selection,
+        so the traces are configured once per server and the layout once per
+        process.
 
         Returns:
-            go.Figure: Plotly figure object containing the stacked bar chart.
+            go.Figure: Configured Plotly figure object without data.
         """
-        data = self._filtered_data()
-        if data.empty:
-            return go.Figure()
+        return go.Figure(
+            data=[
+                self._create_bar_trace(
+                    countries=[],
+                    values=[],
+                    name=properties["name"],
+                    color=properties["color"],
+                    hover_template=properties["hover_template"],
+                )
+                for properties in self.ALLOCATION_TYPES.values()
+            ],
+            layout=self.BASE_LAYOUT,
+        )
+
+    def _update_stacked_bar_chart(
+        self, fig: go.Figure, countries: np.ndarray, values: np.ndarray
+    ) -> go.Figure:
+        """Update the stacked bar chart with new data.
 
+        Works on both the server-side figure and the rendered widget; on a
+        widget, only the changed trace data and height are sent to the browser.
+
+        Args:
+            fig: Plotly figure or figure widget to update in place.
+            countries: Array of country names.
+            values: Matrix of allocation values, one column per trace.
+
+        Returns:
+            go.Figure: The updated figure.
+        """
         # Calculate dynamic height based on number of countries
-        dynamic_height = max(400, len(data) * 40)
+        height = max(400, len(countries) * 40)
 
-        # Create and configure plot
-        fig = self._create_stacked_bar_chart(data, dynamic_height)
+        # Arrays go to Plotly as-is and are serialized as typed binary buffers
+        with fig.batch_update():
+            for trace, column in zip(fig.data, values.T, strict=True):
+                trace.y = countries
+                trace.x = column
+                trace.text = self._format_bar_text(column)
+            fig.layout.height = height
 
         return fig
 
-    def _create_stacked_bar_chart(self, data: pd.DataFrame, height: int) -> go.Figure:
-        """Create a stacked bar chart visualization.
+    @staticmethod
+    def _format_bar_text(values: np.ndarray) -> np.ndarray:
+        """Format bar values as in-bar labels, hiding empty segments.
 
         Args:
-            data: DataFrame containing filtered allocation data.
-            height: Height of the plot in pixels.
+            values: Array of values for the bars.
 
         Returns:
-            go.Figure: Configured Plotly figure object.
+            np.ndarray: Label for each bar.
         """
-        fig = go.Figure()
-        countries = data["country"].tolist()
-
-        # Add traces for each allocation type
-        for alloc_type, properties in self.ALLOCATION_TYPES.items():
-            values = data[alloc_type].tolist()
-            fig.add_trace(
-                self._create_bar_trace(
-                    countries=countries,
-                    values=values,
-                    name=properties["name"],
-                    color=COLOR_PALETTE.get(properties["color"]),
-                    hover_template=properties["hover_template"],
-                )
-            )
-
-        # Update layout
-        self._update_figure_layout(fig, height)
-
-        return fig
+        values = np.asarray(values, dtype=np.float64)
+        return np.where(values > 0, np.char.mod("%.1f", values), "")
 
     def _create_bar_trace(
         self,
@@ -215,66 +307,27 @@ class GDPAllocationsServer:
             orientation="h",
             marker_color=color,
             hovertemplate=f"%{{y}}<br>{hover_template}<extra></extra>",
-            text=[f"{v:.1f}" if v > 0 else "" for v in values],
+            text=self._format_bar_text(values),
             textposition="inside",
             textfont=dict(color="white"),
             insidetextanchor="middle",
         )
 
-    def _update_figure_layout(self, fig: go.Figure, height: int) -> None:
-        """Update the layout of the figure.
+    def register_outputs(self) -> None:
+        """Register the plot output with Shiny.
 
-        Args:
-            fig: Plotly figure object to update.
-            height: Height of the plot in pixels.
+        The widget is rendered once. Later selections patch its traces in place
+        instead of re-sending and re-mounting the whole figure.
         """
-        fig.update_layout(
-            title=dict(
-                text=f"Bilateral Aid, Refugee Costs, and EU Share<br><sub>Last updated: {LAST_UPDATE}, Sheet: Summary(€), Fig 6</sub>",
-                font=dict(size=14),
-                y=0.95,
-                x=0.5,
-                xanchor="center",
-                yanchor="top",
-            ),
-            xaxis_title="Percentage of 2021 GDP",
-            barmode="stack",
-            template="plotly_white",
-            height=height,
-            margin=MARGIN,
-            legend=dict(
-                yanchor="bottom",
-                y=0.01,
-                xanchor="right",
-                x=0.99,
-                bgcolor="rgba(255, 255, 255, 0.8)",
-                bordercolor="rgba(0, 0, 0, 0.2)",
-                borderwidth=1,
-            ),
-            showlegend=True,
-            hovermode="y unified",
-            autosize=True,
-            yaxis=dict(
-                showgrid=False,
-                gridcolor="rgba(0,0,0,0.1)",
-                zerolinecolor="rgba(0,0,0,0.2)",
-                tickfont=dict(size=12),
-                categoryorder="total ascending",
-            ),
-            xaxis=dict(
-                showgrid=False,
-                gridcolor="rgba(0,0,0,0.1)",
-                zerolinecolor="rgba(0,0,0,0.2)",
-                tickformat=".1f",
-            ),
-            plot_bgcolor="rgba(255,255,255,1)",
-            paper_bgcolor="rgba(255,255,255,1)",
-        )
-
-    def register_outputs(self) -> None:
-        """Register the plot output with Shiny."""
 
         @self.output
         @render_widget
         def gdp_allocations_plot():
-            return self.create_plot()
+            with reactive.isolate():
+                return self.create_plot()
+
+        @reactive.effect
+        def _update_gdp_allocations_plot():
+            self._update_stacked_bar_chart(
+                gdp_allocations_plot.widget, *self._filtered_data()
+            )
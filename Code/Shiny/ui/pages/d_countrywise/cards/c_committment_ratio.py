@@ -4,14 +4,32 @@ This module provides components for creating and managing an interactive visuali
 that compares allocated aid against committed aid across different countries.
 """
 
+import functools
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE, MARGIN
-from server import load_data_from_table
-from shiny import reactive, ui
+from server import ALLOCATIONS_VS_COMMITMENTS_QUERY, load_data_from_table
+from shiny import ui
 from shinywidgets import output_widget, render_widget
 
 
+@functools.lru_cache(maxsize=1)
+def load_commitment_ratio_data() -> pd.DataFrame:
+    """Load the allocations versus commitments data once per process.
+
+    Derived columns and the committed-aid ordering are computed by DuckDB, so
+    the top-N selection is a plain slice of the leading rows.
+
+    Returns:
+        pd.DataFrame: Shared DataFrame with allocation ratios and percentages,
+            sorted by committed aid in descending order.
+    """
+    df = load_data_from_table(ALLOCATIONS_VS_COMMITMENTS_QUERY)
+    return df.astype({"country": "category"})
+
+
 class CommittmentRatioCard:
     """UI components for the aid allocation visualization card.
 
@@ -87,9 +105,19 @@ class CommittmentRatioServer:
         input: Shiny input object containing user interface values.
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
-        df (pd.DataFrame): DataFrame containing aid allocation data.
+        df (pd.DataFrame): Shared DataFrame containing aid allocation data.
     """
 
+    # Number of input combinations whose figures are kept for reuse. Three
+    # covers every display mode for the current country count (absolute,
+    # percentage descending and ascending) without holding figures for
+    # counts the user has moved away from.
+    PLOT_CACHE_SIZE = 3
+
+    # Bar colors, resolved once from the palette
+    ALLOCATED_COLOR = COLOR_PALETTE.get("aid_delivered", "#1f77b4")
+    TO_ALLOCATE_COLOR = COLOR_PALETTE.get("aid_committed", "#ff7f0e")
+
     def __init__(self, input, output, session):
         """Initialize the server component.
 
@@ -101,48 +129,33 @@ class CommittmentRatioServer:
         self.input = input
         self.output = output
         self.session = session
-        self.df = self._prepare_initial_data()
-        self._filtered_data = reactive.Calc(self._compute_filtered_data)
+        self.df = load_commitment_ratio_data()
+        self._cached_plot = functools.lru_cache(maxsize=self.PLOT_CACHE_SIZE)(
+            self._build_plot
+        )
         self.register_outputs()
 
-    def _prepare_initial_data(self) -> pd.DataFrame:
-        """Prepare the initial dataset with calculated fields.
-
-        Returns:
-            pd.DataFrame: Processed DataFrame with additional calculated columns.
-        """
-        df = load_data_from_table("d_allocations_vs_commitments")
-        if "allocated_aid" in df.columns and "committed_aid" in df.columns:
-            df["to_be_allocated"] = df["committed_aid"] - df["allocated_aid"]
-            df["delivery_ratio"] = df["allocated_aid"] / df["committed_aid"]
-        return df
+    def _compute_filtered_data(
+        self, show_percentage: bool, reverse_sort: bool, top_n: int
+    ) -> pd.DataFrame:
+        """Select and order the rows for one combination of user inputs.
 
-    def _compute_filtered_data(self) -> pd.DataFrame:
-        """Filter and process data based on user selections.
+        Args:
+            show_percentage: Boolean indicating whether to show percentages.
+            reverse_sort: Boolean indicating sort direction.
+            top_n: Number of countries to display.
 
         Returns:
-            pd.DataFrame: Filtered and sorted DataFrame based on user inputs.
+            pd.DataFrame: Filtered and sorted DataFrame in plot order.
         """
-        result = self.df.copy()
-        show_percentage = self.input.show_percentage_commitment_ratio()
-        reverse_sort = self.input.reverse_sort_commitment_ratio()
+        # self.df is presorted by committed aid, so the top N are the leading rows
+        result = self.df.head(top_n)
 
         if show_percentage:
-            result["allocated_pct"] = (
-                result["allocated_aid"] / result["committed_aid"]
-            ) * 100
-            result["to_be_allocated_pct"] = (
-                result["to_be_allocated"] / result["committed_aid"]
-            ) * 100
-            ascending = not reverse_sort
-            result = result.nlargest(
-                self.input.top_n_countries_committment_ratio(), "committed_aid"
-            )
-            result = result.sort_values("delivery_ratio", ascending=ascending)
+            # Percentage totals are 100% by construction, so the delivery ratio
+            # alone fixes the order
+            result = result.sort_values("delivery_ratio", ascending=not reverse_sort)
         else:
-            result = result.nlargest(
-                self.input.top_n_countries_committment_ratio(), "committed_aid"
-            )
             result = result.sort_values("committed_aid", ascending=True)
 
         return result
@@ -150,110 +163,87 @@ class CommittmentRatioServer:
     def create_plot(self) -> go.Figure:
         """Generate the aid allocation visualization plot.
 
+        Figures are cached per input combination, so returning to a previously
+        shown view does not rebuild it.
+
+        Returns:
+            go.Figure: Plotly figure object containing the stacked bar chart.
+        """
+        show_percentage = self.input.show_percentage_commitment_ratio()
+        # The sort direction only applies in percentage mode, so it is neither
+        # read nor part of the cache key in the absolute view
+        reverse_sort = show_percentage and self.input.reverse_sort_commitment_ratio()
+        top_n = self.input.top_n_countries_committment_ratio()
+        return self._cached_plot(show_percentage, reverse_sort, top_n)
+
+    def _build_plot(
+        self, show_percentage: bool, reverse_sort: bool, top_n: int
+    ) -> go.Figure:
+        """Build the plot for one combination of user inputs.
+
+        The figure depends only on the arguments, which form the cache key.
+
+        Args:
+            show_percentage: Boolean indicating whether to show percentages.
+            reverse_sort: Boolean indicating sort direction.
+            top_n: Number of countries to display.
+
         Returns:
             go.Figure: Plotly figure object containing the stacked bar chart.
         """
-        data = self._filtered_data()
+        data = self._compute_filtered_data(show_percentage, reverse_sort, top_n)
         if data.empty:
             return go.Figure()
 
-        show_percentage = self.input.show_percentage_commitment_ratio()
-        reverse_sort = self.input.reverse_sort_commitment_ratio()
-        country_data = self._prepare_country_data(data, show_percentage)
-
         # Calculate dynamic height based on number of countries
         dynamic_height = max(400, len(data) * 40)
 
         # Create and configure plot
-        fig = self._create_stacked_bar_chart(
-            country_data, show_percentage, reverse_sort, dynamic_height
-        )
+        fig = self._create_stacked_bar_chart(data, show_percentage, dynamic_height)
 
         return fig
 
-    def _prepare_country_data(self, data: pd.DataFrame, show_percentage: bool) -> dict:
-        """Prepare country-specific data for plotting.
-
-        Args:
-            data: DataFrame containing filtered aid data.
-            show_percentage: Boolean indicating whether to show percentages.
-
-        Returns:
-            Dict: Processed country data ready for plotting.
-        """
-        country_data = {}
-        for _, row in data.iterrows():
-            if show_percentage:
-                x_allocated = row["allocated_pct"]
-                x_to_allocate = row["to_be_allocated_pct"]
-            else:
-                x_allocated = row["allocated_aid"]
-                x_to_allocate = row["to_be_allocated"]
-
-            country_data[row["country"]] = {
-                "allocated": x_allocated,
-                "to_allocate": x_to_allocate,
-                "total": x_allocated + x_to_allocate,
-            }
-        return country_data
-
     def _create_stacked_bar_chart(
-        self, country_data: dict, show_percentage: bool, reverse_sort: bool, height: int
+        self, data: pd.DataFrame, show_percentage: bool, height: int
     ) -> go.Figure:
         """Create a stacked bar chart visualization.
 
         Args:
-            country_data: Dictionary containing processed country data.
+            data: DataFrame containing filtered aid data, already in plot order.
             show_percentage: Boolean indicating whether to show percentages.
-            reverse_sort: Boolean indicating sort direction.
             height: Height of the plot in pixels.
 
         Returns:
             go.Figure: Configured Plotly figure object.
         """
-        # Get colors from palette
-        allocated_color = COLOR_PALETTE.get("aid_delivered", "#1f77b4")
-        to_allocate_color = COLOR_PALETTE.get("aid_committed", "#ff7f0e")
-
-        # Sort countries and prepare data
-        sorted_countries = sorted(
-            country_data.keys(),
-            key=lambda x: country_data[x]["total"],
-            reverse=reverse_sort if show_percentage else False,
-        )
+        countries = data["country"].to_numpy()
+        if show_percentage:
+            allocated_values = data["allocated_pct"].to_numpy()
+            to_allocate_values = data["to_be_allocated_pct"].to_numpy()
+        else:
+            allocated_values = data["allocated_aid"].to_numpy()
+            to_allocate_values = data["to_be_allocated"].to_numpy()
 
         hover_suffix = "%" if show_percentage else " Billion €"
 
-        # Create figure and add traces
-        fig = go.Figure()
-
-        allocated_values = [
-            country_data[country]["allocated"] for country in sorted_countries
-        ]
-        to_allocate_values = [
-            country_data[country]["to_allocate"] for country in sorted_countries
-        ]
-
-        # Add allocated aid trace
-        fig.add_trace(
-            self._create_bar_trace(
-                sorted_countries,
-                allocated_values,
-                "Allocated aid",
-                allocated_color,
-                hover_suffix,
-            )
-        )
-
-        # Add to-be-allocated aid trace
-        fig.add_trace(
-            self._create_bar_trace(
-                sorted_countries,
-                to_allocate_values,
-                "Aid to be allocated",
-                to_allocate_color,
-                hover_suffix,
-            )
+        # Create the figure with both traces in a single validation pass
+        fig = go.Figure(
+            data=[
+                self._create_bar_trace(
+                    countries,
+                    allocated_values,
+                    "Allocated aid",
+                    self.ALLOCATED_COLOR,
+                    hover_suffix,
+                ),
+                self._create_bar_trace(
+                    countries,
+                    to_allocate_values,
+                    "Aid to be allocated",
+                    self.TO_ALLOCATE_COLOR,
+                    hover_suffix,
+                ),
+            ]
         )
 
         # Update layout
@@ -263,8 +253,8 @@ class CommittmentRatioServer:
 
     def _create_bar_trace(
         self,
-        countries: list[str],
-        values: list[float],
+        countries: np.ndarray,
+        values: np.ndarray,
         name: str,
         color: str,
         hover_suffix: str,
@@ -272,8 +262,8 @@ class CommittmentRatioServer:
         """Create a bar trace for the stacked bar chart.
 
         Args:
-            countries: List of country names.
-            values: List of values for the bars.
+            countries: Array of country names.
+            values: Array of values for the bars.
             name: Name of the trace.
             color: Color for the bars.
             hover_suffix: Suffix for hover text.
@@ -288,7 +278,7 @@ class CommittmentRatioServer:
             orientation="h",
             marker_color=color,
             hovertemplate=f"%{{y}}<br>{name}: %{{x:.1f}}{hover_suffix}<extra></extra>",
-            text=[f"{v:.1f}" if v > 0 else "" for v in values],
+            text=np.where(values > 0, np.char.mod("%.1f", values), ""),
             textposition="inside",
             textfont=dict(color="white"),
             insidetextanchor="middle",
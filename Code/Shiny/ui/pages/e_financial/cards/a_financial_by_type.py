@@ -8,7 +8,7 @@ provided by donor countries to Ukraine.
 import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE, MARGIN
-from server.database import load_data_from_table
+from server.database import load_cached_data
 from server.queries import FINANCIAL_AID_QUERY
 from shiny import reactive, ui
 from shinywidgets import output_widget, render_widget
@@ -74,6 +74,7 @@ class FinancialByTypeServer:
         input: Shiny input object containing user interface values.
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
+        df (pd.DataFrame): Shared DataFrame containing financial aid data.
     """
 
     # Define financial aid types and their properties
@@ -119,25 +120,30 @@ class FinancialByTypeServer:
         self.input = input
         self.output = output
         self.session = session
+        self.df = load_cached_data(FINANCIAL_AID_QUERY)
+        self._sorted_df = self._prepare_sorted_data()
         self._filtered_data = reactive.Calc(self._compute_filtered_data)
 
-    def _compute_filtered_data(self) -> pd.DataFrame:
-        """Compute filtered data based on user inputs.
+    def _prepare_sorted_data(self) -> pd.DataFrame:
+        """Rank countries by total financial aid once, since the data does not change.
 
         Returns:
-            pd.DataFrame: Filtered and sorted DataFrame containing top N countries.
+            pd.DataFrame: Financial aid data with a total_aid column, sorted by
+                total aid in descending order.
         """
-        df = load_data_from_table(table_name_or_query=FINANCIAL_AID_QUERY)
-
-        # Calculate total aid for sorting
         aid_columns = [props["column"] for props in self.FINANCIAL_AID_TYPES.values()]
-        df["total_aid"] = df[aid_columns].sum(axis=1)
+        df = self.df.assign(total_aid=self.df[aid_columns].sum(axis=1))
+        return df.sort_values("total_aid", ascending=False, kind="stable")
 
-        # Filter to top N countries and sort
-        df = df.nlargest(self.input.top_n_countries(), "total_aid")
-        df = df.sort_values("total_aid", ascending=True)
+    def _compute_filtered_data(self) -> pd.DataFrame:
+        """Compute filtered data based on user inputs.
 
-        return df
+        Returns:
+            pd.DataFrame: Filtered and sorted DataFrame containing top N countries.
+        """
+        # The leading rows are the top N; only they are put in plot order
+        df = self._sorted_df.head(self.input.top_n_countries())
+        return df.sort_values("total_aid", ascending=True)
 
     def create_plot(self) -> go.Figure:
         """Generate the financial aid type visualization plot.
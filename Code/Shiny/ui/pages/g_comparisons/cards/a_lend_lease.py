@@ -6,8 +6,10 @@ WW2 Lend-Lease and current support for Ukraine. It shows both delivered and plan
 equipment transfers across different categories (heavy equipment, artillery, air).
 """
 
+import functools
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, LAST_UPDATE
@@ -18,6 +20,30 @@ from shinywidgets import output_widget, render_widget
 
 from ....colorutilities import desaturate_color
 
+# The conflicts list is constant, so the query is formatted once at import
+WW2_EQUIPMENT_QUERY: str = WW2_EQUIPMENT_CATEGORIZED_QUERY.format(
+    conflicts=", ".join(f"'{conflict}'" for conflict in WW2_CONFLICTS)
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_equipment_data() -> pd.DataFrame:
+    """Load the categorized WW2 equipment data once per process.
+
+    The conflict and category columns are converted to categorical dtype so
+    the repeated equality masks and groupbys compare integer codes instead
+    of strings. The per-category percentages shown in relative mode come from
+    the query itself, so only the sort total is derived here.
+
+    Returns:
+        pd.DataFrame: Shared DataFrame containing the equipment data and the
+            total used for sorting.
+    """
+    df = load_data_from_table(table_name_or_query=WW2_EQUIPMENT_QUERY)
+    return df.astype({"military_conflict": "category", "category": "category"}).assign(
+        total=lambda d: d["delivered"] + d["to_be_delivered"]
+    )
+
 
 class WW2EquipmentComparisonCard:
     """UI components for the WW2 equipment comparison visualization card.
@@ -68,6 +94,7 @@ class WW2EquipmentComparisonServer:
         input: Shiny input object containing user interface values.
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
+        df (pd.DataFrame): Shared DataFrame containing the equipment data.
     """
 
     # Define visualization properties
@@ -86,6 +113,18 @@ class WW2EquipmentComparisonServer:
         },
     }
 
+    # Desaturated variants of the conflict colors used for planned deliveries
+    PLANNED_COLORS: dict[str, str] = {
+        conflict: desaturate_color(COLOR_PALETTE[conflict])
+        for conflict in WW2_CONFLICTS
+    }
+
+    # Value formatting keyed on whether absolute numbers are shown
+    VALUE_FORMATTING: dict[bool, dict[str, str]] = {
+        True: {"suffix": " units", "number_format": ":,d", "value_format": "{:,d}"},
+        False: {"suffix": "%", "number_format": ":.1f", "value_format": "{:.1f}"},
+    }
+
     def __init__(self, input: Any, output: Any, session: Any):
         """Initialize the server component.
 
@@ -97,38 +136,7 @@ class WW2EquipmentComparisonServer:
         self.input = input
         self.output = output
         self.session = session
-
-    def _compute_filtered_data(self) -> pd.DataFrame:
-        """Process and filter data based on user selections.
-
-        Returns:
-            pd.DataFrame: Processed DataFrame containing equipment comparison data.
-        """
-        conflicts_str = ", ".join(f"'{conflict}'" for conflict in WW2_CONFLICTS)
-        query = WW2_EQUIPMENT_CATEGORIZED_QUERY.format(conflicts=conflicts_str)
-        df = load_data_from_table(table_name_or_query=query)
-
-        if not self.input.show_absolute():
-            self._normalize_data(df)
-
-        return df
-
-    def _normalize_data(self, df: pd.DataFrame) -> None:
-        """Normalize data values by category.
-
-        Args:
-            df: DataFrame to normalize (modified in-place).
-        """
-        for category in df["category"].unique():
-            mask = df["category"] == category
-            max_delivered = df.loc[mask, "delivered"].max()
-            if max_delivered > 0:
-                df.loc[mask, "delivered_pct"] = (
-                    df.loc[mask, "delivered"] / max_delivered * 100
-                )
-                df.loc[mask, "to_be_delivered_pct"] = (
-                    df.loc[mask, "to_be_delivered"] / max_delivered * 100
-                )
+        self.df = load_equipment_data()
 
     def create_plot(self) -> go.Figure:
         """Generate the equipment comparison visualization plot.
@@ -136,7 +144,7 @@ class WW2EquipmentComparisonServer:
         Returns:
             go.Figure: Plotly figure object containing the subplot comparison.
         """
-        data = self._compute_filtered_data()
+        data = self.df
         if data.empty:
             return go.Figure()
 
@@ -160,26 +168,33 @@ class WW2EquipmentComparisonServer:
         Returns:
             Dict[str, str]: Dictionary containing formatting strings.
         """
-        if self.input.show_absolute():
-            return {"suffix": " units", "number_format": ":,d", "value_format": "{:,d}"}
-        return {"suffix": "%", "number_format": ":.1f", "value_format": "{:.1f}"}
+        return self.VALUE_FORMATTING[self.input.show_absolute()]
 
     def _add_category_plots(self, fig: go.Figure, data: pd.DataFrame) -> None:
         """Add category-specific plots to the figure.
 
+        Traces for all subplots are collected first and added in a single
+        ``add_traces`` call, so the figure is validated once.
+
         Args:
             fig: Plotly figure to update.
             data: DataFrame containing the visualization data.
         """
         formatting = self._get_value_formatting()
+        traces: list[go.Bar] = []
+        cols: list[int] = []
 
         for category, (_, col) in self.PLOT_CONFIG["subplot_positions"].items():
             category_data = self._prepare_category_data(data, category)
 
             if not category_data.empty:
-                self._add_category_traces(
-                    fig=fig, category_data=category_data, col=col, formatting=formatting
+                category_traces = self._create_category_traces(
+                    category_data=category_data, col=col, formatting=formatting
                 )
+                traces.extend(category_traces)
+                cols.extend([col] * len(category_traces))
+
+        fig.add_traces(traces, rows=1, cols=cols)
 
     def _prepare_category_data(self, data: pd.DataFrame, category: str) -> pd.DataFrame:
         """Prepare data for a specific category.
@@ -191,84 +206,85 @@ class WW2EquipmentComparisonServer:
         Returns:
             pd.DataFrame: Filtered and sorted DataFrame.
         """
-        category_data = data[data["category"] == category].copy()
-        if not category_data.empty:
-            category_data["total"] = (
-                category_data["delivered"] + category_data["to_be_delivered"]
-            )
-            return category_data.sort_values("total", ascending=True)
-        return category_data
+        category_data = data[data["category"] == category]
+        return category_data.sort_values("total", ascending=True)
 
-    def _add_category_traces(
+    def _create_category_traces(
         self,
-        fig: go.Figure,
         category_data: pd.DataFrame,
         col: int,
         formatting: dict[str, str],
-    ) -> None:
-        """Add traces for a specific category to the figure.
+    ) -> list[go.Bar]:
+        """Create the traces for a specific category.
 
         Args:
-            fig: Plotly figure to update.
             category_data: DataFrame containing category-specific data.
             col: Column number for the subplot.
             formatting: Dictionary containing formatting strings.
+
+        Returns:
+            List[go.Bar]: Delivered and planned traces for each conflict.
         """
-        for conflict in category_data["military_conflict"].unique():
-            conflict_data = category_data[
-                category_data["military_conflict"] == conflict
-            ]
+        traces: list[go.Bar] = []
+
+        # Partition once per category instead of masking the frame per conflict
+        by_conflict = category_data.groupby(
+            "military_conflict", observed=True, sort=False
+        )
+        has_planned = (by_conflict["to_be_delivered"].first() > 0).to_dict()
 
+        for conflict, conflict_data in by_conflict:
             values = self._get_trace_values(conflict_data, formatting)
 
             # Add delivered amounts
-            fig.add_trace(
+            traces.append(
                 self._create_delivered_trace(
                     conflict=conflict,
                     values=values,
                     formatting=formatting,
                     show_legend=(col == 1),
-                ),
-                row=1,
-                col=col,
+                )
             )
 
             # Add to-be-delivered amounts if they exist
-            if conflict_data["to_be_delivered"].iloc[0] > 0:
-                fig.add_trace(
+            if has_planned[conflict]:
+                traces.append(
                     self._create_planned_trace(
                         conflict=conflict, values=values, formatting=formatting
-                    ),
-                    row=1,
-                    col=col,
+                    )
                 )
 
+        return traces
+
     def _get_trace_values(
         self, conflict_data: pd.DataFrame, formatting: dict[str, str]
-    ) -> dict[str, Any]:
+    ) -> dict[str, np.ndarray]:
         """Get values for creating traces.
 
+        The values are returned as plain numpy arrays, which Plotly accepts
+        directly and which keep the numeric core of the plot free of pandas.
+
         Args:
             conflict_data: DataFrame containing conflict-specific data.
             formatting: Dictionary containing formatting strings.
 
         Returns:
-            Dict[str, Any]: Dictionary containing trace values.
+            Dict[str, np.ndarray]: Dictionary containing trace values.
         """
         if self.input.show_absolute():
             return {
-                "delivered": conflict_data["delivered"].astype(int),
-                "to_deliver": conflict_data["to_be_delivered"].astype(int),
+                "delivered": conflict_data["delivered"].to_numpy(dtype=int),
+                "to_deliver": conflict_data["to_be_delivered"].to_numpy(dtype=int),
             }
         return {
-            "delivered": conflict_data["delivered_pct"],
-            "to_deliver": conflict_data["to_be_delivered_pct"],
+            "delivered": conflict_data["delivered_pct"].to_numpy(),
+            "to_deliver": conflict_data["to_be_delivered_pct"].to_numpy(),
         }
 
     def _create_delivered_trace(
         self,
         conflict: str,
-        values: dict[str, Any],
+        values: dict[str, np.ndarray],
         formatting: dict[str, str],
         show_legend: bool,
     ) -> go.Bar:
@@ -291,10 +307,7 @@ class WW2EquipmentComparisonServer:
             marker_color=COLOR_PALETTE[conflict],
             legendgroup=conflict,
             showlegend=show_legend,
-            customdata=[
-                [d, t]
-                for d, t in zip(values["delivered"], values["to_deliver"], strict=False)
-            ],
+            customdata=np.column_stack((values["delivered"], values["to_deliver"])),
             hovertemplate=(
                 f"%{{y}}<br>"
                 f"Delivered: %{{customdata[0]{formatting['number_format']}}}{formatting['suffix']}<br>"
@@ -312,7 +325,10 @@ class WW2EquipmentComparisonServer:
         )
 
     def _create_planned_trace(
-        self, conflict: str, values: dict[str, Any], formatting: dict[str, str]
+        self,
+        conflict: str,
+        values: dict[str, np.ndarray],
+        formatting: dict[str, str],
     ) -> go.Bar:
         """Create a trace for planned equipment deliveries.
 
@@ -329,11 +345,11 @@ class WW2EquipmentComparisonServer:
             y=[conflict],
             x=values["to_deliver"],
             orientation="h",
-            marker_color=desaturate_color(COLOR_PALETTE[conflict]),
+            marker_color=self.PLANNED_COLORS[conflict],
             legendgroup=conflict,
             showlegend=False,
             base=values["delivered"],
-            customdata=[[t] for t in values["to_deliver"]],
+            customdata=values["to_deliver"].reshape(-1, 1),
             hovertemplate=(
                 f"%{{y}}<br>"
                 f"Additional to be delivered: %{{customdata[0]{formatting['number_format']}}}"
@@ -429,19 +445,15 @@ class WW2EquipmentComparisonServer:
         Args:
             fig: Plotly figure to update.
         """
-        for i in range(1, 4):
-            fig.update_xaxes(
-                showgrid=True,
-                gridcolor="rgba(0,0,0,0.1)",
-                zeroline=True,
-                zerolinecolor="rgba(0,0,0,0.2)",
-                row=1,
-                col=i,
-                showticklabels=False,
-            )
-            fig.update_yaxes(
-                showgrid=False, title="", showticklabels=False, row=1, col=i
-            )
+        # Without row/col selectors the updates apply to every subplot at once
+        fig.update_xaxes(
+            showgrid=True,
+            gridcolor="rgba(0,0,0,0.1)",
+            zeroline=True,
+            zerolinecolor="rgba(0,0,0,0.2)",
+            showticklabels=False,
+        )
+        fig.update_yaxes(showgrid=False, title="", showticklabels=False)
 
     def register_outputs(self) -> None:
         """Register the plot output with Shiny."""
@@ -5,6 +5,7 @@ that compares military support values between WW2 Lend-Lease programs and curren
 Ukraine support, showing both absolute values and GDP share comparisons.
 """
 
+from functools import cached_property
 from typing import Any
 
 import pandas as pd
@@ -94,7 +95,11 @@ class WW2UkraineComparisonServer:
         self.input = input
         self.output = output
         self.session = session
-        self.comparison_data = load_data_from_table(WW2_COMPARISON_QUERY)
+
+    @cached_property
+    def comparison_data(self) -> pd.DataFrame:
+        """WW2 comparison data, loaded on first access."""
+        return load_data_from_table(WW2_COMPARISON_QUERY)
 
     def _prepare_data(self) -> pd.DataFrame:
         """Process and prepare data for visualization.
@@ -5,6 +5,7 @@ that compares historical US military expenditure across major conflicts with cur
 Ukraine support, showing both absolute values and GDP share comparisons.
 """
 
+from functools import cached_property
 from typing import Any
 
 import pandas as pd
@@ -87,7 +88,11 @@ class ColdWarServer:
         self.input = input
         self.output = output
         self.session = session
-        self.expenditure_data = load_data_from_table(US_WARS_COMPARISON_QUERY)
+
+    @cached_property
+    def expenditure_data(self) -> pd.DataFrame:
+        """US wars comparison data, loaded on first access."""
+        return load_data_from_table(US_WARS_COMPARISON_QUERY)
 
     def _prepare_data(self) -> pd.DataFrame:
         """Process and prepare data for visualization.
@@ -5,8 +5,10 @@ that compares military expenditure during the Gulf War (1990/91) with current ai
 to Ukraine, showing both absolute values and GDP share comparisons.
 """
 
+from functools import cached_property
 from typing import Any
 
+import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, COMPARISONS_MARGIN, LAST_UPDATE
 from server import load_data_from_table
@@ -67,6 +69,7 @@ class GulfWarServer:
         output: Shiny output object for rendering visualizations.
         session: Shiny session object.
         comparison_data: DataFrame containing the comparison data.
+        _fig_cache: Figures already built, keyed on the absolute-values toggle.
     """
 
     # Define visualization properties
@@ -99,7 +102,12 @@ class GulfWarServer:
         self.input = input
         self.output = output
         self.session = session
-        self.comparison_data = load_data_from_table(GULF_WAR_COMPARISON_QUERY)
+        self._fig_cache: dict[bool, go.Figure] = {}
+
+    @cached_property
+    def comparison_data(self) -> pd.DataFrame:
+        """Gulf War comparison data, loaded on first access."""
+        return load_data_from_table(GULF_WAR_COMPARISON_QUERY)
 
     def _get_display_config(self) -> dict[str, str]:
         """Get display configuration based on view type.
@@ -124,12 +132,20 @@ class GulfWarServer:
     def create_plot(self) -> go.Figure:
         """Generate the comparison visualization plot.
 
+        The figure only depends on the absolute-values toggle, so each of the
+        two variants is built once and reused on subsequent toggles.
+
         Returns:
             go.Figure: Plotly figure object containing the comparison visualization.
         """
-        fig = self._create_bar_chart()
-        self._update_figure_layout(fig)
-        return fig
+        show_absolute = self.input.show_absolute_gulfwar_values()
+
+        if show_absolute not in self._fig_cache:
+            fig = self._create_bar_chart()
+            self._update_figure_layout(fig)
+            self._fig_cache[show_absolute] = fig
+
+        return self._fig_cache[show_absolute]
 
     def _create_bar_chart(self) -> go.Figure:
         """Create the bar chart visualization.
@@ -168,10 +184,10 @@ class GulfWarServer:
             else trace_config["columns"]["relative"]
         )
 
-        values = self.comparison_data[column].tolist()
+        values = self.comparison_data[column].to_numpy()
 
         return go.Bar(
-            x=self.comparison_data["countries"].tolist(),
+            x=self.comparison_data["countries"].to_numpy(),
             y=values,
             name=trace_config["name"],
             marker_color=trace_config["color"],
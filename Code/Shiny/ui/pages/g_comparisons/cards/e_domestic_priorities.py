@@ -5,11 +5,15 @@ that compare different types of European support, including crisis responses,
 domestic support vs Ukraine aid, and German spending programs.
 """
 
+from collections.abc import Callable
+from functools import cached_property
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from config import COLOR_PALETTE, COMPARISONS_MARGIN, LAST_UPDATE
-from server import load_data_from_table
+from server import load_cached_data
 from server.queries import (
     DOMESTIC_COMPARISON_QUERY,
     EUROPEAN_CRISIS_QUERY,
@@ -103,6 +107,7 @@ class DomesticPrioritiesServer:
         domestic_data: DataFrame containing domestic comparison data.
         crisis_data: DataFrame containing crisis comparison data.
         german_data: DataFrame containing German spending data.
+        _fig_cache: Figures already built, keyed on plot name and toggle state.
     """
 
     # Define visualization properties
@@ -145,9 +150,22 @@ class DomesticPrioritiesServer:
         self.input = input
         self.output = output
         self.session = session
-        self.domestic_data = load_data_from_table(DOMESTIC_COMPARISON_QUERY)
-        self.crisis_data = load_data_from_table(EUROPEAN_CRISIS_QUERY)
-        self.german_data = load_data_from_table(GERMAN_COMPARISON_QUERY)
+        self._fig_cache: dict[tuple[str, bool], go.Figure] = {}
+
+    @cached_property
+    def domestic_data(self) -> pd.DataFrame:
+        """Domestic comparison data, loaded on first access."""
+        return load_cached_data(DOMESTIC_COMPARISON_QUERY)
+
+    @cached_property
+    def crisis_data(self) -> pd.DataFrame:
+        """Crisis comparison data, loaded on first access."""
+        return load_cached_data(EUROPEAN_CRISIS_QUERY)
+
+    @cached_property
+    def german_data(self) -> pd.DataFrame:
+        """German spending data, loaded on first access."""
+        return load_cached_data(GERMAN_COMPARISON_QUERY)
 
     def create_german_spending_plot(self) -> go.Figure:
         """Generate the German spending comparison plot.
@@ -170,14 +188,37 @@ class DomesticPrioritiesServer:
         Returns:
             List[Dict[str, Any]]: Processed program data.
         """
+        commitments = self.german_data["commitments"]
+        names = commitments.map(self.PLOT_CONFIG["german_display_names"])
+        colors = commitments.map(COLOR_PALETTE)
+
+        # map() leaves unknown programs as NaN; fail like a direct lookup would
+        unmapped = commitments[names.isna() | colors.isna()]
+        if not unmapped.empty:
+            raise KeyError(
+                f"No display name or color configured for: {unmapped.tolist()}"
+            )
+
+        # Programs without a cost figure fall back to total bilateral aid
+        cost = self.german_data["cost"].to_numpy()
+        values = np.where(
+            cost > 0, cost, self.german_data["total_bilateral_aid"].to_numpy()
+        )
+
         return [
             {
-                "name": self.PLOT_CONFIG["german_display_names"][row["commitments"]],
-                "original_name": row["commitments"],
-                "value": row["cost"] if row["cost"] > 0 else row["total_bilateral_aid"],
-                "color": COLOR_PALETTE[row["commitments"]],
+                "name": name,
+                "original_name": original_name,
+                "value": value,
+                "color": color,
             }
-            for row in self.german_data.to_dict("records")
+            for name, original_name, value, color in zip(
+                names.to_numpy(),
+                commitments.to_numpy(),
+                values,
+                colors.to_numpy(),
+                strict=True,
+            )
         ]
 
     def create_crisis_comparison_plot(self) -> go.Figure:
@@ -187,13 +228,21 @@ class DomesticPrioritiesServer:
             go.Figure: Plotly figure object containing the comparison visualization.
         """
         fig = go.Figure()
+        commitments = self.crisis_data["commitments"]
+        colors = commitments.map(COLOR_PALETTE)
+
+        # map() leaves unknown commitments as NaN; fail like a direct lookup would
+        unmapped = commitments[colors.isna()]
+        if not unmapped.empty:
+            raise KeyError(f"No color configured for: {unmapped.tolist()}")
 
-        for commitment, value in zip(
-            self.crisis_data["commitments"],
+        for commitment, value, color in zip(
+            commitments,
             self.crisis_data["total_support__billion"],
-            strict=False,
+            colors,
+            strict=True,
         ):
-            fig.add_trace(self._create_crisis_trace(commitment, value))
+            fig.add_trace(self._create_crisis_trace(commitment, value, color))
 
         self._update_crisis_layout(fig)
         return fig
@@ -224,14 +273,14 @@ class DomesticPrioritiesServer:
             return {
                 "value_suffix": "B€",
                 "y_axis_title": "Billion €",
-                "fiscal_values": self.domestic_data["fiscal_abs"].tolist(),
-                "ukraine_values": self.domestic_data["ukraine_abs"].tolist(),
+                "fiscal_values": self.domestic_data["fiscal_abs"].to_numpy(),
+                "ukraine_values": self.domestic_data["ukraine_abs"].to_numpy(),
             }
         return {
             "value_suffix": "%",
             "y_axis_title": "percent of GDP",
-            "fiscal_values": self.domestic_data["fiscal_gdp"].tolist(),
-            "ukraine_values": self.domestic_data["ukraine_gdp"].tolist(),
+            "fiscal_values": self.domestic_data["fiscal_gdp"].to_numpy(),
+            "ukraine_values": self.domestic_data["ukraine_gdp"].to_numpy(),
         }
 
     def _create_base_layout(self, title: str, sheet: str) -> dict[str, Any]:
@@ -296,12 +345,13 @@ class DomesticPrioritiesServer:
         base_layout.update({"xaxis_title": "Billion €", "barmode": "group"})
         fig.update_layout(**base_layout)
 
-    def _create_crisis_trace(self, commitment: str, value: float) -> go.Bar:
+    def _create_crisis_trace(self, commitment: str, value: float, color: str) -> go.Bar:
         """Create a trace for crisis comparison visualization.
 
         Args:
             commitment: Commitment name.
             value: Support value.
+            color: Bar color for the commitment.
 
         Returns:
             go.Bar: Configured bar trace.
@@ -311,7 +361,7 @@ class DomesticPrioritiesServer:
             x=[value],
             orientation="h",
             name=commitment,
-            marker_color=COLOR_PALETTE[commitment],
+            marker_color=color,
             text=f"{value:.1f}B€",
             textposition="auto",
             hovertemplate="%{y}<br>Amount: %{x:.1f}B€",
@@ -338,7 +388,16 @@ class DomesticPrioritiesServer:
             fig: Plotly figure to update.
             display_config: Display configuration settings.
         """
-        countries = self.domestic_data["countries"].tolist()
+        countries = self.domestic_data["countries"].to_numpy()
+        customdata = np.column_stack(
+            (display_config["fiscal_values"], display_config["ukraine_values"])
+        )
+        suffix = display_config["value_suffix"]
+        hovertemplate = (
+            f"%{{y}}<br>"
+            f"Energy Subsidies: %{{customdata[0]:.2f}}{suffix}<br>"
+            f"Ukraine Aid: %{{customdata[1]:.2f}}{suffix}"
+        )
 
         # Add fiscal commitments trace
         fig.add_trace(
@@ -348,23 +407,10 @@ class DomesticPrioritiesServer:
                 name="Fiscal commitments for energy subsidies",
                 marker_color=COLOR_PALETTE["Fiscal commitments for energy subsidies"],
                 orientation="h",
-                text=[
-                    f"{x:.2f}{display_config['value_suffix']}"
-                    for x in display_config["fiscal_values"]
-                ],
+                text=[f"{x:.2f}{suffix}" for x in display_config["fiscal_values"]],
                 textposition="auto",
-                customdata=list(
-                    zip(
-                        display_config["fiscal_values"],
-                        display_config["ukraine_values"],
-                        strict=False,
-                    )
-                ),
-                hovertemplate=(
-                    f"%{{y}}<br>"
-                    f"Energy Subsidies: %{{customdata[0]:.2f}}{display_config['value_suffix']}<br>"
-                    f"Ukraine Aid: %{{customdata[1]:.2f}}{display_config['value_suffix']}"
-                ),
+                customdata=customdata,
+                hovertemplate=hovertemplate,
             )
         )
 
@@ -376,23 +422,10 @@ class DomesticPrioritiesServer:
                 name="Aid for Ukraine (incl. EU share)",
                 marker_color=COLOR_PALETTE["Aid for Ukraine (incl. EU share)"],
                 orientation="h",
-                text=[
-                    f"{x:.2f}{display_config['value_suffix']}"
-                    for x in display_config["ukraine_values"]
-                ],
+                text=[f"{x:.2f}{suffix}" for x in display_config["ukraine_values"]],
                 textposition="auto",
-                customdata=list(
-                    zip(
-                        display_config["fiscal_values"],
-                        display_config["ukraine_values"],
-                        strict=False,
-                    )
-                ),
-                hovertemplate=(
-                    f"%{{y}}<br>"
-                    f"Energy Subsidies: %{{customdata[0]:.2f}}{display_config['value_suffix']}<br>"
-                    f"Ukraine Aid: %{{customdata[1]:.2f}}{display_config['value_suffix']}"
-                ),
+                customdata=customdata,
+                hovertemplate=hovertemplate,
             )
         )
 
@@ -409,20 +442,46 @@ class DomesticPrioritiesServer:
         base_layout.update({"xaxis_title": y_axis_title, "barmode": "group"})
         fig.update_layout(**base_layout)
 
+    def _get_cached_figure(
+        self, key: tuple[str, bool], builder: Callable[[], go.Figure]
+    ) -> go.Figure:
+        """Return a cached figure, building it on first request.
+
+        The crisis and German plots do not depend on any input and the domestic
+        plot only on the absolute-values toggle, so each variant is built once.
+
+        Args:
+            key: Plot name and toggle state identifying the figure.
+            builder: Function creating the figure if it is not cached yet.
+
+        Returns:
+            go.Figure: The cached Plotly figure.
+        """
+        if key not in self._fig_cache:
+            self._fig_cache[key] = builder()
+        return self._fig_cache[key]
+
     def register_outputs(self) -> None:
         """Register all plot outputs with Shiny."""
 
         @self.output
         @render_widget
         def crisis_comparison_plot() -> go.Figure:
-            return self.create_crisis_comparison_plot()
+            return self._get_cached_figure(
+                ("crisis", False), self.create_crisis_comparison_plot
+            )
 
         @self.output
         @render_widget
         def domestic_support_plot() -> go.Figure:
-            return self.create_domestic_support_plot()
+            return self._get_cached_figure(
+                ("domestic", self.input.show_absolute_domestic_values()),
+                self.create_domestic_support_plot,
+            )
 
         @self.output
         @render_widget
         def german_spending_plot() -> go.Figure:
-            return self.create_german_spending_plot()
+            return self._get_cached_figure(
+                ("german", False), self.create_german_spending_plot
+            )